@@ -10,34 +10,60 @@ id, nombre, posicion, puntos, rebotes, asistencias
 Requisitos cumplidos:
 ✔ Jerarquía 3 niveles
 ✔ Persistencia CSV (with open)
-✔ Recursividad para lectura global
+✔ Recorrido completo del árbol para lectura global
 ✔ CRUD + ordenamiento + estadísticas
 ✔ Manejo de errores y validaciones
 """
 
 import os
 import csv
-import uuid
-from typing import List, Dict, Any, Optional
+import functools
+import pickle
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
 
 # ---------------------------
 # CONFIGURACIÓN GLOBAL
 # ---------------------------
 BASE_DIR = os.path.join(os.getcwd(), "data", "nba")
 CSV_FILENAME = "players.csv"
-CSV_HEADERS = ["id", "nombre", "posicion", "puntos", "rebotes", "asistencias"]
+STATS_FILENAME = "stats.npy"
+INDICE_FILENAME = ".id_index.pkl"
+CSV_HEADERS = ("id", "nombre", "posicion", "puntos", "rebotes", "asistencias")
+LINEA_ENCABEZADO = ",".join(CSV_HEADERS) + "\n"
+
+POSICIONES_VALIDAS = frozenset({"base", "escolta", "alero", "ala-pivot", "pivot"})
+
+# Offsets de columna para las filas posicionales que devuelve leer_csv.
+IDX_ID, IDX_NOMBRE, IDX_POSICION, IDX_PUNTOS, IDX_REBOTES, IDX_ASISTENCIAS = range(6)
+
+# Buffers de E/S: el default de Python (8 KiB) obliga a un read/write
+# por cada bloque chico; con buffers grandes el barrido lineal de los
+# CSV hace muchas menos llamadas al sistema.
+BUF_LECTURA = 1 << 18   # 256 KiB
+BUF_ESCRITURA = 1 << 20  # 1 MiB
 
 
 # ---------------------------
 # VALIDACIONES
 # ---------------------------
 def validar_nombre(nombre: str) -> bool:
-    return isinstance(nombre, str) and nombre.strip() != ""
+    # Sin comas, comillas ni saltos de línea: así toda fila escrita por
+    # el módulo se serializa con el formateador directo, sin escapado csv.
+    return (isinstance(nombre, str) and nombre.strip() != ""
+            and "," not in nombre and '"' not in nombre
+            and "\r" not in nombre and "\n" not in nombre)
 
 
 def validar_posicion(posicion: str) -> bool:
-    posiciones_validas = {"base", "escolta", "alero", "ala-pivot", "pivot"}
-    return posicion.lower() in posiciones_validas
+    # Camino rápido: lo normal es que ya venga en minúsculas, así que se
+    # prueba directo contra el frozenset antes de pagar el .lower().
+    return posicion in POSICIONES_VALIDAS or posicion.lower() in POSICIONES_VALIDAS
 
 
 def validar_estadistica(valor: Any) -> bool:
@@ -51,8 +77,14 @@ def validar_estadistica(valor: Any) -> bool:
 # ---------------------------
 # UTILIDADES
 # ---------------------------
+@functools.lru_cache(maxsize=None)
 def asegurar_directorio(*partes: str) -> str:
-    """Crea directorios si no existen y devuelve la ruta final."""
+    """Crea directorios si no existen y devuelve la ruta final.
+
+    Memoizada: el primer alta de cada (conferencia, equipo) hace el
+    os.makedirs real; las siguientes devuelven la ruta sin syscalls.
+    Si alguna vez se borran directorios, usar .cache_clear().
+    """
     ruta = os.path.join(BASE_DIR, *partes)
     os.makedirs(ruta, exist_ok=True)
     return ruta
@@ -61,37 +93,273 @@ def asegurar_directorio(*partes: str) -> str:
 def inicializar_csv_si_necesario(ruta_dir: str) -> str:
     """Crea el CSV si no existe."""
     ruta_csv = os.path.join(ruta_dir, CSV_FILENAME)
-    if not os.path.exists(ruta_csv):
-        with open(ruta_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
+    try:
+        # O_EXCL crea el archivo y detecta si ya existía en una sola
+        # syscall, sin el stat previo de os.path.exists; el encabezado
+        # ya está armado en el módulo, no hace falta un DictWriter.
+        # 0o666 + umask deja los permisos normales de archivo de datos.
+        fd = os.open(ruta_csv, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(LINEA_ENCABEZADO)
+    except FileExistsError:
+        pass
     return ruta_csv
 
 
-def leer_csv(ruta_csv: str) -> List[Dict[str, str]]:
+# Los CSV que escribe este módulo no llevan comillas ni comas embebidas,
+# así que pueden partirse con str.split sin pasar por el módulo csv.
+# Poner en False si los archivos provienen de otra fuente.
+LECTURA_RAPIDA = True
+
+
+def _leer_csv_rapido(ruta_csv: str) -> Optional[List[Tuple[str, ...]]]:
+    """Lee el archivo entero de una vez y parte las líneas con split.
+
+    Un solo read() + decode del buffer completo y bytes/str.split (en C)
+    evitan el despacho línea por línea de csv.reader. Si alguna fila no
+    respeta el esquema simple (comillas o cantidad de columnas rara, por
+    ejemplo un archivo externo) devuelve None para que el llamador caiga
+    al lector estándar.
+    """
+    with open(ruta_csv, "rb") as f:
+        datos = f.read()
+
+    filas = []
+    for linea in datos.decode("utf-8").splitlines()[1:]:
+        if not linea:
+            continue
+        if '"' in linea:
+            return None
+        campos = linea.split(",")
+        if len(campos) != len(CSV_HEADERS):
+            return None
+        filas.append(tuple(campos))
+    return filas
+
+
+def leer_csv(ruta_csv: str) -> List[Tuple[str, ...]]:
+    """Lee un players.csv y devuelve las filas como tuplas posicionales.
+
+    Se usa csv.reader en lugar de csv.DictReader para no armar un
+    diccionario por fila; las columnas se acceden con los offsets IDX_*.
+    """
     jugadores = []
     try:
-        with open(ruta_csv, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        if LECTURA_RAPIDA:
+            filas = _leer_csv_rapido(ruta_csv)
+            if filas is not None:
+                return filas
+        with open(ruta_csv, "r", newline="", encoding="utf-8", buffering=BUF_LECTURA) as f:
+            reader = csv.reader(f)
+            next(reader, None)  # saltea el encabezado
             for fila in reader:
-                jugadores.append(fila)
+                jugadores.append(tuple(fila))
     except FileNotFoundError:
         return []
     return jugadores
 
 
-def escribir_csv(ruta_csv: str, filas: List[Dict[str, Any]]) -> None:
-    with open(ruta_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-        writer.writeheader()
-        writer.writerows(filas)
+# Pool de IDs pregenerados: una sola llamada grande a os.urandom rinde
+# _TAM_LOTE_IDS identificadores, en lugar de un getrandom() por alta.
+_TAM_LOTE_IDS = 512
+_POOL_IDS: deque = deque()
+
+
+def _nuevo_id() -> str:
+    """Devuelve un ID hexadecimal de 128 bits tomado del pool."""
+    if not _POOL_IDS:
+        buf = os.urandom(16 * _TAM_LOTE_IDS)
+        _POOL_IDS.extend(buf[i * 16:(i + 1) * 16].hex() for i in range(_TAM_LOTE_IDS))
+    return _POOL_IDS.popleft()
+
+
+@contextmanager
+def _abrir_csv_lote(ruta_csv: str):
+    """Abre el CSV una sola vez con buffer grande y entrega un writer.
+
+    Permite escribir varias filas seguidas sin reabrir el archivo por
+    cada una: un solo open/close y menos llamadas al sistema.
+    """
+    with open(ruta_csv, "a", newline="", encoding="utf-8", buffering=BUF_ESCRITURA) as f:
+        # lineterminator="\n" para que los appends usen el mismo fin de
+        # línea que el formateador directo de las reescrituras.
+        yield csv.DictWriter(f, fieldnames=CSV_HEADERS, lineterminator="\n")
+
+
+# Con True se hace fsync antes de publicar cada reescritura (más lento).
+# Aun en False el rename atómico garantiza que ningún lector vea un CSV
+# a medio escribir; solo se arriesga la última escritura ante un corte.
+FSYNC_ESCRITURAS = False
+
+
+def _formatear_filas(filas: List[List[str]]) -> Optional[str]:
+    """Serializa encabezado y filas con str.join, sin pasar por csv.
+
+    El esquema es fijo y los validadores no dejan entrar comas ni
+    comillas, así que el escapado general de csv.writer no hace falta.
+    Si alguna fila sí lo necesitara (archivo de origen externo) devuelve
+    None y el llamador cae al csv.writer estándar.
+    """
+    lineas = [",".join(CSV_HEADERS)]
+    for fila in filas:
+        if len(fila) != len(CSV_HEADERS):
+            return None
+        linea = ",".join(fila)
+        if (linea.count(",") != len(CSV_HEADERS) - 1 or '"' in linea
+                or "\n" in linea or "\r" in linea):
+            return None
+        lineas.append(linea)
+    return "\n".join(lineas) + "\n"
+
+
+def escribir_csv(ruta_csv: str, filas: List[List[str]]) -> None:
+    """Reescribe el CSV de forma atómica: temporal + os.replace.
+
+    Mientras se prepara el archivo nuevo los lectores siguen viendo el
+    viejo; un corte a mitad de escritura no corrompe el original.
+    """
+    ruta_tmp = ruta_csv + ".tmp"
+    contenido = _formatear_filas(filas)
+    with open(ruta_tmp, "w", newline="", encoding="utf-8", buffering=BUF_ESCRITURA) as f:
+        if contenido is not None:
+            f.write(contenido)
+        else:
+            # QUOTE_ALL: con lineterminator="\n" el QUOTE_MINIMAL de csv
+            # ya no escaparía un \r suelto; acá solo caen filas que
+            # necesitan escapado, así que se entrecomilla todo.
+            writer = csv.writer(f, lineterminator="\n", quoting=csv.QUOTE_ALL)
+            writer.writerow(CSV_HEADERS)
+            writer.writerows(filas)
+        if FSYNC_ESCRITURAS:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(ruta_tmp, ruta_csv)
+
+
+# Buffer de filas mutables por archivo: ruta -> (mtime, filas como listas).
+# Las actualizaciones masivas mutan el mismo buffer en el lugar en vez de
+# reparsear el CSV y reconstruir tuplas en cada mutación.
+_BUFFER_FILAS: Dict[str, Tuple[float, List[List[str]]]] = {}
+
+
+def _filas_mutables(ruta_csv: str) -> List[List[str]]:
+    """Filas del CSV como listas mutables, reutilizadas entre escrituras."""
+    try:
+        mtime = os.path.getmtime(ruta_csv)
+    except OSError:
+        mtime = -1.0
+    en_buffer = _BUFFER_FILAS.get(ruta_csv)
+    if en_buffer is not None and en_buffer[0] == mtime:
+        return en_buffer[1]
+    filas = [list(f) for f in leer_csv(ruta_csv)]
+    _BUFFER_FILAS[ruta_csv] = (mtime, filas)
+    return filas
+
+
+def _guardar_filas_mutables(ruta_csv: str, filas: List[List[str]]) -> None:
+    """Reescribe el CSV y deja el buffer válido para la próxima mutación."""
+    escribir_csv(ruta_csv, filas)
+    _BUFFER_FILAS[ruta_csv] = (os.path.getmtime(ruta_csv), filas)
+
+
+# ---------------------------
+# ÍNDICE DE IDS
+# ---------------------------
+# Mapea id -> (ruta_csv, índice de fila) para ubicar un jugador con una
+# búsqueda O(1) en vez de recorrer toda la jerarquía en cada operación.
+_INDICE_IDS: Optional[Dict[str, Tuple[str, int]]] = None
+
+# Cantidad de filas de datos por CSV, para saber en qué posición queda un
+# alta sin tener que releer el archivo.
+_FILAS_POR_CSV: Dict[str, int] = {}
+
+
+def _construir_indice() -> Dict[str, Tuple[str, int]]:
+    """Recorre la jerarquía una sola vez y arma el índice id -> ubicación."""
+    indice: Dict[str, Tuple[str, int]] = {}
+    _FILAS_POR_CSV.clear()
+    for raiz, _dirs, archivos in os.walk(BASE_DIR):
+        if CSV_FILENAME in archivos:
+            ruta_csv = os.path.join(raiz, CSV_FILENAME)
+            filas = leer_csv(ruta_csv)
+            for i, fila in enumerate(filas):
+                indice[fila[IDX_ID]] = (ruta_csv, i)
+            _FILAS_POR_CSV[ruta_csv] = len(filas)
+    return indice
+
+
+def _ruta_indice() -> str:
+    return os.path.join(BASE_DIR, INDICE_FILENAME)
+
+
+def _firma_archivos_csv() -> Tuple[Tuple[str, int], ...]:
+    """Firma (ruta, mtime_ns) de cada players.csv, solo con stat."""
+    if not os.path.exists(BASE_DIR):
+        return ()
+    return tuple((r, os.stat(r).st_mtime_ns) for r in sorted(_listar_rutas_csv(BASE_DIR)))
+
+
+def _cargar_indice_persistido() -> Optional[Dict[str, Tuple[str, int]]]:
+    """Intenta cargar el índice guardado en el arranque anterior.
+
+    Solo se acepta si la firma de mtimes de todos los CSV coincide con
+    la guardada; ante cualquier diferencia (o archivo dañado) devuelve
+    None y el índice se reconstruye recorriendo el árbol.
+    """
+    try:
+        with open(_ruta_indice(), "rb") as f:
+            datos = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+    if not isinstance(datos, dict) or datos.get("firma") != _firma_archivos_csv():
+        return None
+    _FILAS_POR_CSV.clear()
+    _FILAS_POR_CSV.update(datos["filas_por_csv"])
+    return datos["indice"]
+
+
+def _persistir_indice() -> None:
+    """Guarda el índice en disco para que el próximo arranque no recorra el árbol."""
+    if _INDICE_IDS is None:
+        return
+    datos = {
+        "firma": _firma_archivos_csv(),
+        "indice": _INDICE_IDS,
+        "filas_por_csv": dict(_FILAS_POR_CSV),
+    }
+    try:
+        with open(_ruta_indice(), "wb") as f:
+            pickle.dump(datos, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # sin persistencia, el próximo arranque reconstruye
+
+
+def _obtener_indice() -> Dict[str, Tuple[str, int]]:
+    global _INDICE_IDS
+    if _INDICE_IDS is None:
+        _INDICE_IDS = _cargar_indice_persistido()
+    if _INDICE_IDS is None:
+        _INDICE_IDS = _construir_indice()
+    return _INDICE_IDS
+
+
+def _ubicar_jugador(jugador_id: str) -> Optional[Tuple[str, int]]:
+    """Devuelve (ruta_csv, índice de fila) del jugador, o None si no existe."""
+    global _INDICE_IDS
+    indice = _obtener_indice()
+    if jugador_id not in indice:
+        # Si los CSV se editaron por fuera del programa el índice puede
+        # quedar desactualizado: se reconstruye una vez antes de rendirse.
+        _INDICE_IDS = _construir_indice()
+        indice = _INDICE_IDS
+    return indice.get(jugador_id)
 
 
 # ---------------------------
 # CRUD
 # ---------------------------
-def alta_jugador(conferencia: str, equipo: str, jugador: Dict[str, Any]) -> Dict[str, str]:
-    """Crea un nuevo jugador dentro de la jerarquía."""
+def _normalizar_jugador(jugador: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida un jugador y devuelve sus campos normalizados, con id nuevo."""
     if not validar_nombre(jugador.get("nombre", "")):
         raise ValueError("Nombre inválido.")
     if not validar_posicion(jugador.get("posicion", "")):
@@ -100,11 +368,8 @@ def alta_jugador(conferencia: str, equipo: str, jugador: Dict[str, Any]) -> Dict
         if not validar_estadistica(jugador.get(stat, 0)):
             raise ValueError(f"Valor inválido en {stat}")
 
-    dir_path = asegurar_directorio(conferencia, equipo)
-    ruta_csv = inicializar_csv_si_necesario(dir_path)
-
-    nuevo = {
-        "id": str(uuid.uuid4()),
+    return {
+        "id": _nuevo_id(),
         "nombre": jugador["nombre"].strip(),
         "posicion": jugador["posicion"].lower(),
         "puntos": float(jugador["puntos"]),
@@ -112,84 +377,326 @@ def alta_jugador(conferencia: str, equipo: str, jugador: Dict[str, Any]) -> Dict
         "asistencias": float(jugador["asistencias"]),
     }
 
-    jugadores = leer_csv(ruta_csv)
-    jugadores.append({k: str(v) for k, v in nuevo.items()})
-    escribir_csv(ruta_csv, jugadores)
+
+def alta_jugador(conferencia: str, equipo: str, jugador: Dict[str, Any]) -> Dict[str, str]:
+    """Crea un nuevo jugador dentro de la jerarquía."""
+    nuevo = _normalizar_jugador(jugador)
+
+    dir_path = asegurar_directorio(conferencia, equipo)
+    ruta_csv = inicializar_csv_si_necesario(dir_path)
+
+    # Alta por append: una sola fila escrita, sin releer ni reescribir
+    # el resto del archivo (el encabezado ya lo dejó inicializar_csv).
+    indice = _obtener_indice()
+    with _abrir_csv_lote(ruta_csv) as writer:
+        writer.writerow({k: str(v) for k, v in nuevo.items()})
+
+    idx = _FILAS_POR_CSV.get(ruta_csv, 0)
+    indice[nuevo["id"]] = (ruta_csv, idx)
+    _FILAS_POR_CSV[ruta_csv] = idx + 1
+    _escribir_stats_npy(ruta_csv)
+    _invalidar_cache_lectura()
     return nuevo
 
 
-def leer_todos_los_jugadores(base_dir: Optional[str] = None) -> List[Dict[str, str]]:
-    """Función RECURSIVA que recorre toda la jerarquía NBA."""
+def alta_jugadores_bulk(conferencia: str, equipo: str,
+                        jugadores: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Alta masiva: valida fila por fila pero abre el CSV una sola vez.
+
+    Todos los jugadores se validan antes de escribir nada (si uno es
+    inválido no se da de alta ninguno) y después se vuelcan por un
+    único writer con buffer grande; el índice de IDs y el sidecar de
+    estadísticas se actualizan en bloque al final.
+    """
+    nuevos = [_normalizar_jugador(j) for j in jugadores]
+    if not nuevos:
+        return []
+
+    dir_path = asegurar_directorio(conferencia, equipo)
+    ruta_csv = inicializar_csv_si_necesario(dir_path)
+
+    indice = _obtener_indice()
+    with _abrir_csv_lote(ruta_csv) as writer:
+        for nuevo in nuevos:
+            writer.writerow({k: str(v) for k, v in nuevo.items()})
+
+    idx = _FILAS_POR_CSV.get(ruta_csv, 0)
+    for nuevo in nuevos:
+        indice[nuevo["id"]] = (ruta_csv, idx)
+        idx += 1
+    _FILAS_POR_CSV[ruta_csv] = idx
+    _escribir_stats_npy(ruta_csv)
+    _invalidar_cache_lectura()
+    return nuevos
+
+
+# Cache de lecturas globales: base_dir -> (firma de mtimes, resultado).
+# Evita repetir el recorrido recursivo cuando nada cambió entre llamadas.
+_CACHE_LECTURA: Dict[str, Tuple[Tuple[Tuple[str, float], ...], List[Tuple[str, Tuple[str, ...]]]]] = {}
+
+
+def _firma_directorios(base_dir: str) -> Tuple[Tuple[str, float], ...]:
+    """Firma barata del árbol: solo stat de cada directorio, sin abrir CSVs."""
+    firma = []
+    for raiz, _dirs, _archivos in os.walk(base_dir):
+        firma.append((raiz, os.path.getmtime(raiz)))
+    return tuple(firma)
+
+
+def _invalidar_cache_lectura() -> None:
+    # Reescribir un CSV no cambia el mtime de su directorio, así que el
+    # CRUD invalida el cache de forma explícita en vez de confiar en la firma.
+    _CACHE_LECTURA.clear()
+
+
+def leer_todos_los_jugadores(base_dir: Optional[str] = None) -> List[Tuple[str, Tuple[str, ...]]]:
+    """Recorre toda la jerarquía NBA, con cache entre llamadas repetidas.
+
+    Devuelve pares (ruta_csv, fila) con filas posicionales; los
+    diccionarios se arman recién en el borde de la interfaz.
+    """
     if base_dir is None:
         base_dir = BASE_DIR
 
-    todos = []
+    if not os.path.exists(base_dir):
+        return []
+
+    firma = _firma_directorios(base_dir)
+    en_cache = _CACHE_LECTURA.get(base_dir)
+    if en_cache is not None and en_cache[0] == firma:
+        return en_cache[1]
+
+    todos = _leer_jugadores_arbol(base_dir)
+    _CACHE_LECTURA[base_dir] = (firma, todos)
+    return todos
+
+
+def _listar_rutas_csv(base_dir: str) -> List[str]:
+    """Junta las rutas de todos los players.csv con una pila y os.scandir.
+
+    Las entradas de scandir ya traen el tipo (dir/archivo) del propio
+    readdir, así que no hace falta un stat extra por elemento; la pila
+    reemplaza la recursión para ahorrar un frame de Python por nivel.
+    """
+    rutas = []
+    pendientes = deque([base_dir])
+    while pendientes:
+        actual = pendientes.pop()
+        with os.scandir(actual) as it:
+            for entrada in it:
+                if entrada.is_dir(follow_symlinks=False):
+                    pendientes.append(entrada.path)
+                elif entrada.name == CSV_FILENAME:
+                    rutas.append(entrada.path)
+    return rutas
+
+
+def iter_todos_los_jugadores(base_dir: Optional[str] = None) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+    """Versión generadora de leer_todos_los_jugadores.
+
+    Produce los pares (ruta_csv, fila) de a uno, archivo por archivo,
+    sin materializar la lista global ni tocar el cache: memoria acotada
+    para recorridos de solo lectura de una sola pasada. El menú usa la
+    variante con lista, que aprovecha el cache entre llamadas.
+    """
+    if base_dir is None:
+        base_dir = BASE_DIR
 
     if not os.path.exists(base_dir):
-        return todos
-
-    for elemento in os.listdir(base_dir):
-        ruta = os.path.join(base_dir, elemento)
-        if os.path.isdir(ruta):
-            todos.extend(leer_todos_los_jugadores(ruta))  # recursividad
-        elif os.path.basename(ruta) == CSV_FILENAME:
-            filas = leer_csv(ruta)
-            for f in filas:
-                f["_origen"] = ruta
-                todos.append(f)
+        return
+
+    for ruta in _listar_rutas_csv(base_dir):
+        for fila in leer_csv(ruta):
+            yield (ruta, fila)
+
+
+def _leer_jugadores_arbol(base_dir: str) -> List[Tuple[str, Tuple[str, ...]]]:
+    """Lee todos los players.csv del árbol, parseándolos en paralelo.
+
+    Cada CSV es independiente y el GIL se libera durante el read(), así
+    que un pool de hilos solapa la E/S y el parseo entre archivos.
+    """
+    rutas = _listar_rutas_csv(base_dir)
+    if not rutas:
+        return []
+
+    trabajadores = min(32, (os.cpu_count() or 1) * 4, len(rutas))
+    with ThreadPoolExecutor(max_workers=trabajadores) as pool:
+        resultados = pool.map(leer_csv, rutas)
+
+    todos = []
+    for ruta, filas in zip(rutas, resultados):
+        for fila in filas:
+            todos.append((ruta, fila))
     return todos
 
 
 def actualizar_jugador(jugador_id: str, cambios: Dict[str, Any]) -> Dict[str, str]:
     """Actualiza un jugador existente por su ID."""
-    todos = leer_todos_los_jugadores()
-    for j in todos:
-        if j["id"] == jugador_id:
-            ruta = j["_origen"]
-            jugadores = leer_csv(ruta)
-            for fila in jugadores:
-                if fila["id"] == jugador_id:
-                    fila.update({
-                        "nombre": cambios.get("nombre", fila["nombre"]),
-                        "posicion": cambios.get("posicion", fila["posicion"]),
-                        "puntos": cambios.get("puntos", fila["puntos"]),
-                        "rebotes": cambios.get("rebotes", fila["rebotes"]),
-                        "asistencias": cambios.get("asistencias", fila["asistencias"]),
-                    })
-                    escribir_csv(ruta, jugadores)
-                    return fila
-    raise KeyError("Jugador no encontrado.")
+    ubicacion = _ubicar_jugador(jugador_id)
+    if ubicacion is None:
+        raise KeyError("Jugador no encontrado.")
+    ruta, idx = ubicacion
+    jugadores = _filas_mutables(ruta)
+    fila = jugadores[idx]
+    fila[IDX_NOMBRE] = str(cambios.get("nombre", fila[IDX_NOMBRE]))
+    fila[IDX_POSICION] = str(cambios.get("posicion", fila[IDX_POSICION]))
+    fila[IDX_PUNTOS] = str(cambios.get("puntos", fila[IDX_PUNTOS]))
+    fila[IDX_REBOTES] = str(cambios.get("rebotes", fila[IDX_REBOTES]))
+    fila[IDX_ASISTENCIAS] = str(cambios.get("asistencias", fila[IDX_ASISTENCIAS]))
+    _guardar_filas_mutables(ruta, jugadores)
+    _escribir_stats_npy(ruta, jugadores)
+    _invalidar_cache_lectura()
+    return dict(zip(CSV_HEADERS, fila))
 
 
 def eliminar_jugador(jugador_id: str) -> bool:
-    todos = leer_todos_los_jugadores()
-    for j in todos:
-        if j["id"] == jugador_id:
-            ruta = j["_origen"]
-            jugadores = leer_csv(ruta)
-            nuevos = [f for f in jugadores if f["id"] != jugador_id]
-            escribir_csv(ruta, nuevos)
-            return True
-    return False
+    ubicacion = _ubicar_jugador(jugador_id)
+    if ubicacion is None:
+        return False
+    ruta, idx = ubicacion
+    jugadores = _filas_mutables(ruta)
+    # La posición ya la dio el índice: se borra en el lugar, sin
+    # reconstruir la lista comparando id por id.
+    del jugadores[idx]
+    _guardar_filas_mutables(ruta, jugadores)
+    _FILAS_POR_CSV[ruta] = len(jugadores)
+    _escribir_stats_npy(ruta, jugadores)
+    _invalidar_cache_lectura()
+    indice = _obtener_indice()
+    del indice[jugador_id]
+    # Las filas posteriores del mismo CSV se corren un lugar hacia arriba.
+    for otro_id, (otra_ruta, otro_idx) in indice.items():
+        if otra_ruta == ruta and otro_idx > idx:
+            indice[otro_id] = (otra_ruta, otro_idx - 1)
+    return True
 
 
 # ---------------------------
 # ESTADÍSTICAS
 # ---------------------------
-def estadisticas_globales(jugadores: List[Dict[str, str]]) -> Dict[str, Any]:
-    total = len(jugadores)
+def _ruta_stats(ruta_csv: str) -> str:
+    return os.path.join(os.path.dirname(ruta_csv), STATS_FILENAME)
+
+
+def _parsear_stats_csv(ruta_csv: str) -> np.ndarray:
+    """Parsea solo las columnas numéricas de un CSV como matriz float32."""
+    try:
+        with warnings.catch_warnings():
+            # Un CSV recién inicializado (solo encabezado) no tiene datos;
+            # loadtxt lo avisa con un warning pero devuelve la forma correcta.
+            warnings.simplefilter("ignore")
+            return np.loadtxt(
+                ruta_csv,
+                delimiter=",",
+                skiprows=1,
+                usecols=(IDX_PUNTOS, IDX_REBOTES, IDX_ASISTENCIAS),
+                dtype=np.float32,
+                ndmin=2,
+            )
+    except FileNotFoundError:
+        return np.empty((0, 3), dtype=np.float32)
+    except ValueError:
+        # loadtxt no entiende campos entre comillas (archivos legados con
+        # nombres con coma): se cae a leer_csv, que sí los parsea bien,
+        # igual que hace el camino de lectura con _leer_csv_rapido.
+        filas = leer_csv(ruta_csv)
+        return np.array(
+            [(f[IDX_PUNTOS], f[IDX_REBOTES], f[IDX_ASISTENCIAS]) for f in filas],
+            dtype=np.float32,
+        ).reshape(-1, 3)
+
+
+def _escribir_stats_npy(ruta_csv: str, filas: Optional[List[List[str]]] = None) -> None:
+    """Guarda las columnas numéricas del equipo en un stats.npy binario.
+
+    El camino de estadísticas solo necesita estas 3 columnas; tenerlas
+    pre-parseadas en formato columnar evita volver a tocar el CSV.
+    Si el llamador ya tiene las filas en memoria las aprovecha.
+    """
+    try:
+        if filas is None:
+            matriz = _parsear_stats_csv(ruta_csv)
+        else:
+            matriz = np.array(
+                [(f[IDX_PUNTOS], f[IDX_REBOTES], f[IDX_ASISTENCIAS]) for f in filas],
+                dtype=np.float32,
+            ).reshape(-1, 3)
+        np.save(_ruta_stats(ruta_csv), matriz)
+    except (OSError, ValueError):
+        # Valores no numéricos (cambios sin validar) o fallo de disco:
+        # sin sidecar, las estadísticas siguen saliendo del CSV y la
+        # operación CRUD que ya se escribió no debe fallar por esto.
+        pass
+
+
+# Cache en memoria de columnas numéricas: ruta_csv -> (mtime, matriz).
+# Las llamadas repetidas a estadísticas cuestan un stat por archivo en
+# lugar de volver a convertir (o siquiera abrir) nada.
+_CACHE_FLOATS: Dict[str, Tuple[float, np.ndarray]] = {}
+
+
+def _cargar_stats_array(ruta_csv: str) -> np.ndarray:
+    """Columnas numéricas de un equipo, con cache en memoria por mtime.
+
+    Si el CSV no cambió se devuelve la matriz ya parseada. Ante un
+    cambio se prefiere el sidecar stats.npy fresco (mmap, sin parseo) y
+    recién en última instancia se parsea el CSV, regenerando el sidecar.
+    """
+    try:
+        mtime_csv = os.path.getmtime(ruta_csv)
+    except OSError:
+        return np.empty((0, 3), dtype=np.float32)
+
+    en_cache = _CACHE_FLOATS.get(ruta_csv)
+    if en_cache is not None and en_cache[0] == mtime_csv:
+        return en_cache[1]
+
+    ruta_npy = _ruta_stats(ruta_csv)
+    matriz = None
+    try:
+        if os.path.getmtime(ruta_npy) >= mtime_csv:
+            matriz = np.load(ruta_npy, mmap_mode="r")
+    except OSError:
+        pass
+    if matriz is None:
+        matriz = _parsear_stats_csv(ruta_csv)
+        try:
+            np.save(ruta_npy, matriz)
+        except OSError:
+            pass
+
+    _CACHE_FLOATS[ruta_csv] = (mtime_csv, matriz)
+    return matriz
+
+
+def leer_todas_las_estadisticas(base_dir: Optional[str] = None) -> np.ndarray:
+    """Junta las columnas numéricas de toda la jerarquía en una sola matriz."""
+    if base_dir is None:
+        base_dir = BASE_DIR
+
+    rutas = _listar_rutas_csv(base_dir) if os.path.exists(base_dir) else []
+    if not rutas:
+        return np.empty((0, 3), dtype=np.float32)
+
+    trabajadores = min(32, (os.cpu_count() or 1) * 4, len(rutas))
+    with ThreadPoolExecutor(max_workers=trabajadores) as pool:
+        matrices = list(pool.map(_cargar_stats_array, rutas))
+    return np.concatenate(matrices)
+
+
+def estadisticas_globales(stats: np.ndarray) -> Dict[str, Any]:
+    """Promedios globales calculados con reducciones vectorizadas de NumPy."""
+    total = int(stats.shape[0])
     if total == 0:
         return {"total": 0}
 
-    puntos = [float(j["puntos"]) for j in jugadores]
-    rebotes = [float(j["rebotes"]) for j in jugadores]
-    asistencias = [float(j["asistencias"]) for j in jugadores]
-
+    medias = stats.mean(axis=0)
     return {
         "total_jugadores": total,
-        "promedio_puntos": sum(puntos) / total,
-        "promedio_rebotes": sum(rebotes) / total,
-        "promedio_asistencias": sum(asistencias) / total,
+        "promedio_puntos": float(medias[0]),
+        "promedio_rebotes": float(medias[1]),
+        "promedio_asistencias": float(medias[2]),
     }
 
 
@@ -200,7 +707,8 @@ def menu():
     while True:
         print("\n=== GESTOR NBA ===")
         print("1. Alta de jugador")
-        print("2. Listar todos (recursivo)")
+        print("1b. Alta masiva desde archivo")
+        print("2. Listar todos")
         print("3. Actualizar jugador")
         print("4. Eliminar jugador")
         print("5. Estadísticas globales")
@@ -229,14 +737,39 @@ def menu():
             except Exception as e:
                 print("Error:", e)
 
+        elif op == "1b":
+            conferencia = input("Conferencia (este/oeste): ").lower().strip()
+            equipo = input("Equipo: ").lower().replace(" ", "_")
+            ruta = input("Archivo (una línea nombre,posicion,puntos,rebotes,asistencias por jugador): ").strip()
+
+            try:
+                jugadores = []
+                with open(ruta, "r", encoding="utf-8") as f:
+                    for linea in f:
+                        linea = linea.strip()
+                        if not linea:
+                            continue
+                        nombre, posicion, puntos, rebotes, asistencias = linea.split(",")
+                        jugadores.append({
+                            "nombre": nombre,
+                            "posicion": posicion,
+                            "puntos": puntos,
+                            "rebotes": rebotes,
+                            "asistencias": asistencias
+                        })
+                nuevos = alta_jugadores_bulk(conferencia, equipo, jugadores)
+                print(f"{len(nuevos)} jugadores agregados.")
+            except Exception as e:
+                print("Error:", e)
+
         elif op == "2":
             todos = leer_todos_los_jugadores()
             if not todos:
                 print("No hay jugadores cargados.")
             else:
                 print("\n--- LISTA DE JUGADORES ---")
-                for j in todos:
-                    print(f"{j['nombre']} ({j['posicion']}) - {j['puntos']} pts, {j['rebotes']} reb, {j['asistencias']} ast")
+                for _ruta, j in todos:
+                    print(f"{j[IDX_NOMBRE]} ({j[IDX_POSICION]}) - {j[IDX_PUNTOS]} pts, {j[IDX_REBOTES]} reb, {j[IDX_ASISTENCIAS]} ast")
 
         elif op == "3":
             id_jugador = input("ID del jugador a actualizar: ")
@@ -256,13 +789,13 @@ def menu():
                 print("No se encontró el jugador.")
 
         elif op == "5":
-            jugadores = leer_todos_los_jugadores()
-            stats = estadisticas_globales(jugadores)
+            stats = estadisticas_globales(leer_todas_las_estadisticas())
             print("\n--- ESTADÍSTICAS GLOBALES ---")
             for k, v in stats.items():
                 print(f"{k}: {v}")
 
         elif op == "0":
+            _persistir_indice()
             print("Saliendo...")
             break
         else: